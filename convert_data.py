@@ -0,0 +1,11 @@
+import pandas as pd
+
+# ====================
+# KONVERSI DATA
+# ====================
+# Jalankan sekali setiap kali all_data.csv diperbarui:
+#     python convert_data.py
+# Parquet menyimpan tipe kolom (termasuk tanggal) sehingga dashboard
+# tidak perlu mem-parsing ulang teks CSV setiap kali dijalankan.
+df = pd.read_csv("all_data.csv", parse_dates=['dteday'])
+df.to_parquet("all_data.parquet", index=False)
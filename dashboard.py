@@ -1,5 +1,11 @@
+import io
+import os
+from datetime import datetime, time, timedelta
 import pandas as pd
+import polars as pl
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import seaborn as sns
 import streamlit as st
 from babel.numbers import format_number
@@ -53,11 +59,16 @@ st.markdown("---")  # Garis pemisah sebelum filter
 # ====================
 # KONFIGURASI VISUAL
 # ====================
-sns.set_style("whitegrid", {'grid.linestyle': '--', 'grid.alpha': 0.4})
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial']
-plt.rcParams['axes.titlesize'] = 16
-plt.rcParams['axes.labelsize'] = 12
+# Style matplotlib/seaborn berlaku global per proses, jadi cukup diatur sekali
+@st.cache_resource
+def init_style():
+    sns.set_style("whitegrid", {'grid.linestyle': '--', 'grid.alpha': 0.4})
+    plt.rcParams['font.family'] = 'sans-serif'
+    plt.rcParams['font.sans-serif'] = ['Arial']
+    plt.rcParams['axes.titlesize'] = 16
+    plt.rcParams['axes.labelsize'] = 12
+
+init_style()
 
 # Palette Warna
 SEASON_COLORS = ["#FF9AA2", "#FFB7B2", "#FFDAC1", "#E2F0CB"]  # Warna pastel untuk musim
@@ -70,135 +81,183 @@ SEASON_LABELS = {1: "Semi", 2: "Panas", 3: "Gugur", 4: "Dingin"}
 WEATHER_LABELS = {1: "Cerah", 2: "Berkabut", 3: "Hujan/Salju", 4: "Hujan Lebat"}
 DAY_TYPE_LABELS = {0: "Weekend/Holiday", 1: "Weekday"}
 
-# ====================
-# FUNGSI UTAMA
-# ====================
-def load_data():
-    df = pd.read_csv("all_data.csv")
-    df['dteday'] = pd.to_datetime(df['dteday'])
-    df['season_label'] = df['season'].map(SEASON_LABELS)
-    df['weather_label'] = df['weathersit'].map(WEATHER_LABELS)
-    df['day_type'] = df['workingday'].map(DAY_TYPE_LABELS)
-    return df
-
-def create_daily_summary(df):
-    return df.resample('D', on='dteday').agg({
-        'cnt': ['sum', 'mean', 'max']
-    }).reset_index()
+# Warna musim dipetakan per label agar tetap sama dengan legenda walau musim difilter
+SEASON_PALETTE = {label: SEASON_COLORS[i] for i, label in enumerate(SEASON_LABELS.values())}
 
-# ====================
-# LOAD DATA
-# ====================
-all_df = load_data()
+# Sumber data
+DATA_FILE = "all_data.parquet"  # Dibuat dari all_data.csv lewat convert_data.py
 
 # ====================
-# SIDEBAR FILTER
+# FUNGSI UTAMA
 # ====================
-min_date = all_df['dteday'].min().date()
-max_date = all_df['dteday'].max().date()
-
-with st.sidebar:
-    col1, col2, col3 = st.columns([1,2,1])
-    with col2:
-        st.image("https://camo.githubusercontent.com/e7e99e60ef795eb3ae37545e6a1f84391d462097d74c69d378daaab5660ed444/687474703a2f2f6369747962696b2e65732f66696c65732f707962696b65732e706e67", 
-                 width=150)
-    
-    st.header("Filter Data")
-
-    # Date range filter dengan validasi
-    date_range = st.date_input(
-        label='Rentang Waktu',
-        min_value=min_date,
-        max_value=max_date,
-        value=[min_date, max_date]
+# mtime hanya dipakai sebagai kunci cache agar data dibaca ulang saat file berubah.
+# Hasilnya satu DataFrame Polars yang dipakai bersama oleh semua sesi; max_entries=1
+# membuang frame lama begitu file Parquet ditulis ulang.
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_data(path, mtime):
+    # Parquet sudah bertipe (termasuk kolom tanggal), jadi tidak ada parsing teks
+    return pl.read_parquet(path).with_columns(
+        # Kolom integer kecil diperkecil tipenya untuk menghemat memori dan mempercepat group_by
+        pl.col(['hr', 'season', 'workingday', 'weathersit']).cast(pl.Int8),
+        pl.col('cnt').cast(pl.Int32),
+        # Label disimpan sebagai Enum (kode integer per baris, urutan sesuai dict mapping)
+        # dan dibangun langsung dari kolom kodenya dalam satu pass vektor
+        season_label=pl.col('season').replace_strict(
+            SEASON_LABELS, return_dtype=pl.Enum(list(SEASON_LABELS.values()))
+        ),
+        weather_label=pl.col('weathersit').replace_strict(
+            WEATHER_LABELS, return_dtype=pl.Enum(list(WEATHER_LABELS.values()))
+        ),
+        day_type=pl.col('workingday').replace_strict(
+            DAY_TYPE_LABELS, return_dtype=pl.Enum(list(DAY_TYPE_LABELS.values()))
+        )
+    # Urutkan berdasarkan tanggal (sort stabil menjaga urutan jam dalam satu hari).
+    # Kolom dteday jadi bertanda terurut, sehingga search_sorted dan group_by per hari
+    # memakai jalur cepat untuk kunci terurut.
+    ).sort('dteday', maintain_order=True)
+
+# Fungsi create_* hanya menyusun query; eksekusinya digabung di create_summaries.
+# Label hasil agregasi dijadikan string agar seaborn hanya memberi slot pada label
+# yang benar-benar ada setelah filter, bukan pada seluruh kategori Enum.
+def create_daily_summary(lf):
+    # Data sudah terurut per tanggal, jadi urutan grup cukup dipertahankan tanpa sort ulang
+    return lf.group_by('dteday', maintain_order=True).agg(
+        total=pl.col('cnt').sum(),
+        avg=pl.col('cnt').mean(),
+        peak=pl.col('cnt').max()
     )
 
-    if isinstance(date_range, tuple) and len(date_range) == 2:
-        start_date, end_date = date_range
-    else:
-        start_date, end_date = None, None
-
-    # Additional filters
-    selected_seasons = st.multiselect(
-        "Pilih Musim",
-        options=list(SEASON_LABELS.values()),
-        default=list(SEASON_LABELS.values())
+def create_season_summary(lf):
+    # arg_max/arg_min mengambil baris pertama (tanggal & jam paling awal) saat nilai sama
+    return lf.group_by('season').agg(
+        pl.col('season_label').first().cast(pl.String),
+        dteday_max=pl.col('dteday').get(pl.col('cnt').arg_max()),
+        hr_max=pl.col('hr').get(pl.col('cnt').arg_max()),
+        cnt_max_actual=pl.col('cnt').max(),
+        dteday_min=pl.col('dteday').get(pl.col('cnt').arg_min()),
+        hr_min=pl.col('hr').get(pl.col('cnt').arg_min()),
+        cnt_min_actual=pl.col('cnt').min()
+    ).sort('season')
+
+def create_weekday_summary(lf):
+    # Weekend/Holiday lebih dulu di sumbu x (warna dipetakan per label di grafik)
+    return lf.group_by('workingday').agg(
+        pl.col('day_type').first().cast(pl.String),
+        total=pl.col('cnt').sum(),
+        average=pl.col('cnt').mean(),
+        count=pl.len()
+    ).sort('workingday').drop('workingday')
+
+def create_hourly_base(lf):
+    # Satu group_by dipakai bersama oleh grafik per jam dan grafik cuaca. Rata-rata
+    # diturunkan dari jumlah dan banyak baris agar tetap tepat saat digabung ulang.
+    return lf.group_by(['hr', 'workingday', 'weathersit']).agg(
+        pl.col('day_type').first().cast(pl.String),
+        pl.col('weather_label').first().cast(pl.String),
+        cnt_sum=pl.col('cnt').sum(),
+        rows=pl.len()
     )
-    
-    selected_day_types = st.multiselect(
-        "Pilih Jenis Hari",
-        options=list(DAY_TYPE_LABELS.values()),
-        default=list(DAY_TYPE_LABELS.values())
+
+def create_hourly_pattern(hourly_base):
+    # Weekday lebih dulu di legenda (warna dipetakan per label di grafik)
+    return hourly_base.group_by(['hr', 'workingday']).agg(
+        pl.col('day_type').first(),
+        cnt=pl.col('cnt_sum').sum() / pl.col('rows').sum()
+    ).sort(['hr', 'workingday'], descending=[False, True]).drop('workingday')
+
+def create_weather_comparison(hourly_base):
+    return hourly_base.filter(pl.col('weathersit').is_in([1, 2])).group_by(['weathersit', 'hr']).agg(
+        pl.col('weather_label').first(),
+        cnt=pl.col('cnt_sum').sum() / pl.col('rows').sum()
+    ).sort(['weathersit', 'hr'])
+
+# Satu-satunya tempat filter sidebar diterapkan. Hasilnya di-cache berdasarkan
+# kombinasi filter sehingga interaksi widget lain tidak menghitung ulang. Tiap entri
+# menyimpan baris terfilter, jadi jumlahnya dibatasi agar memori tidak terus tumbuh.
+SUMMARY_CACHE_SIZE = 16
+
+@st.cache_data(show_spinner=False, max_entries=SUMMARY_CACHE_SIZE)
+def create_summaries(mtime, start_date, end_date, seasons, day_types):
+    df = load_data(DATA_FILE, mtime)
+    # Data terurut per tanggal, jadi batas rentang waktu dicari dengan search_sorted
+    # (O(log N)) dan diambil lewat slice tanpa memindai seluruh kolom tanggal
+    lo = df['dteday'].search_sorted(datetime.combine(start_date, time()), side='left')
+    hi = df['dteday'].search_sorted(datetime.combine(end_date + timedelta(days=1), time()), side='left')
+    lf = df.slice(lo, hi - lo).lazy()
+    # Filter musim dan jenis hari membandingkan kode integer, dan hanya ditambahkan
+    # bila pilihan dipersempit (default: semua terpilih)
+    if len(seasons) < len(SEASON_LABELS):
+        lf = lf.filter(pl.col('season').is_in([k for k, v in SEASON_LABELS.items() if v in seasons]))
+    if len(day_types) < len(DAY_TYPE_LABELS):
+        lf = lf.filter(pl.col('workingday').is_in([k for k, v in DAY_TYPE_LABELS.items() if v in day_types]))
+
+    hourly_base = create_hourly_base(lf)
+
+    # Baris terfilter dan kelima agregasi dieksekusi bersamaan sehingga filter
+    # (dan hourly_base) yang sama cukup dihitung sekali
+    filtered, daily, season, weekday, hourly, weather = pl.collect_all([
+        lf,
+        create_daily_summary(lf),
+        create_season_summary(lf),
+        create_weekday_summary(lf),
+        create_hourly_pattern(hourly_base),
+        create_weather_comparison(hourly_base)
+    ])
+
+    # Kolom cuaca diurutkan sesuai kode weathersit (Cerah lalu Berkabut)
+    weather = weather.to_pandas()
+    weather_comparison = weather.pivot(
+        index='hr', columns='weather_label', values='cnt'
+    )[weather['weather_label'].unique()]
+
+    return (
+        filtered.to_pandas(),
+        daily.to_pandas(),
+        season.to_pandas(),
+        weekday.to_pandas(),
+        hourly.to_pandas(),
+        weather_comparison
     )
 
 # ====================
-# PROCESS DATA
+# FUNGSI VISUALISASI
 # ====================
-if not start_date or not end_date:
-    st.warning("Silahkan pilih rentang waktu terlebih dahulu.")
-    
-main_df = all_df[
-    (all_df['dteday'].dt.date >= start_date) & 
-    (all_df['dteday'].dt.date <= end_date) &
-    (all_df['season_label'].isin(selected_seasons)) &
-    (all_df['day_type'].isin(selected_day_types))
-]
-
-# Cek apakah main_df kosong
-if main_df.empty:
-    st.warning("Tidak ada data yang bisa kamu lihat, silahkan pilih filter lainnya.")
-else:
-    daily_summary = create_daily_summary(main_df)
-    max_day = main_df.loc[main_df['cnt'].idxmax()]
-    min_day = main_df.loc[main_df['cnt'].idxmin()]
-
-    # ====================
-    # DASHBOARD LAYOUT
-    # ====================
-    st.title('Dashboard Bike Sharing 🚲')
-    st.markdown("""
-    Dashboard ini menampilkan analisis pola penyewaan sepeda berdasarkan berbagai faktor seperti musim, 
-    cuaca, dan jenis hari. Gunakan filter di sidebar untuk menyesuaikan tampilan data.
-    """)
-
-    # TAMBAHKAN: TAMPILKAN RENTANG WAKTU YANG DIPILIH
-    st.subheader(f"📅 Periode: {start_date.strftime('%d %B %Y')} - {end_date.strftime('%d %B %Y')}")
-    st.markdown(f"""
-    - **Total Hari**: {(end_date - start_date).days + 1} hari
-    - **Musim Terpilih**: {', '.join(selected_seasons)}
-    - **Jenis Hari Terpilih**: {', '.join(selected_day_types)}
-    """)
-    st.markdown("---")
-
-    # SECTION 1: METRIC UTAMA
-    st.header("📊 Ringkasan Utama")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Penyewaan", 
-                 value=f"{daily_summary['cnt']['sum'].sum():,}",
-                 help="Total sepeda yang disewa dalam periode terpilih")
-        
-    with col2:
-        st.metric("Rata-rata Harian", 
-                 value=f"{daily_summary['cnt']['mean'].mean():.0f}",
-                 help="Rata-rata penyewaan per hari")
-        
-    with col3:
-        st.metric("Puncak Tertinggi", 
-                 value=f"{daily_summary['cnt']['max'].max():,}",
-                 help="Penyewaan tertinggi dalam satu hari")
+# Yang di-cache per kombinasi filter adalah hasil PNG, bukan Figure: bagian
+# termahal adalah savefig (dpi=200, bbox_inches='tight') yang pada st.pyplot
+# dijalankan di setiap rerun, dan Figure yang dibagi antar sesi bisa dipakai
+# bersamaan oleh beberapa thread. Figure dibuat lewat matplotlib.figure.Figure
+# (bukan pyplot) agar tidak tertahan di daftar figure global pyplot.
+FIGURE_CACHE_SIZE = 16
+
+# Argumen savefig sama dengan yang dipakai st.pyplot, jadi tampilan tidak berubah
+def figure_to_png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    return buf.getvalue()
+
+# Elemen legenda musim hanya bergantung pada warna statis, jadi cukup dibuat sekali
+@st.cache_resource
+def create_season_legend():
+    return [
+        Patch(facecolor=SEASON_COLORS[0], edgecolor='black', label='Musim Semi'),
+        Patch(facecolor=SEASON_COLORS[1], edgecolor='black', label='Musim Panas'),
+        Patch(facecolor=SEASON_COLORS[2], edgecolor='black', label='Musim Gugur'),
+        Patch(facecolor=SEASON_COLORS[3], edgecolor='black', label='Musim Dingin')
+    ]
 
-    # SECTION 2: TREN HARIAN
-    st.header("📈 Tren Harian Penyewaan")
-    fig, ax = plt.subplots(figsize=(16, 6))
-    sns.lineplot(
-        data=daily_summary,
-        x='dteday',
-        y=('cnt', 'sum'),
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_SIZE)
+def render_daily_chart(mtime, start_date, end_date, seasons, day_types):
+    _, daily_summary, _, _, _, _ = create_summaries(mtime, start_date, end_date, seasons, day_types)
+    fig = Figure(figsize=(16, 6))
+    ax = fig.subplots()
+    ax.plot(
+        daily_summary['dteday'].to_numpy(),
+        daily_summary['total'].to_numpy(),
         color=MAIN_COLOR,
         linewidth=2.5,
         marker='o',
-        markersize=8
+        markersize=8,
+        markeredgecolor='white'
     )
 
     ax.set_title("Perkembangan Jumlah Penyewaan Harian", pad=20)
@@ -207,51 +266,21 @@ else:
     ax.grid(True, alpha=0.3)
 
     # Highlight puncak tertinggi
-    max_point = daily_summary.loc[daily_summary[('cnt', 'sum')].idxmax()]
-    ax.annotate(f'Puncak: {max_point[("cnt", "sum")]:,}',
-            xy=(max_point['dteday'], max_point[('cnt', 'sum')]),  # Titik yang ditandai
-            xytext=(max_point['dteday'] + pd.Timedelta(days=3), max_point[('cnt', 'sum')] + 10),  # Posisi teks (ditambah 3 hari ke kanan)
+    max_point = daily_summary.iloc[int(daily_summary['total'].to_numpy().argmax())]
+    ax.annotate(f'Puncak: {max_point["total"]:,}',
+            xy=(max_point['dteday'], max_point['total']),  # Titik yang ditandai
+            xytext=(max_point['dteday'] + pd.Timedelta(days=3), max_point['total'] + 10),  # Posisi teks (ditambah 3 hari ke kanan)
             arrowprops=dict(facecolor=SECONDARY_COLOR, shrink=0.05),
             ha='left',  # Align text ke kiri dari xytext
             bbox=dict(boxstyle='round,pad=0.5', fc='white', alpha=0.8))
 
-    st.pyplot(fig)
+    return figure_to_png(fig)
 
-    # SECTION 3: ANALISIS MUSIMAN (Pertanyaan 1)
-    st.header("🍂 Analisis Musiman")
-    st.markdown("**Bagaimana distribusi penyewaan tertinggi dan terendah dalam satu musim bila diukur dengan jam serta hari?**")
-
-    season_summary = main_df.groupby(['season', 'season_label']).agg({
-        'cnt': ['max', 'min'],
-        'dteday': ['first', 'last'],
-        'hr': ['first', 'last']
-    }).reset_index()
-
-    # Rename columns for easier access
-    season_summary.columns = ['season', 'season_label', 'cnt_max', 'cnt_min', 
-                             'dteday_first', 'dteday_last', 'hr_first', 'hr_last']
-
-    # Find the actual days with max/min counts
-    max_days = main_df.loc[main_df.groupby('season')['cnt'].idxmax()]
-    min_days = main_df.loc[main_df.groupby('season')['cnt'].idxmin()]
-
-    season_summary = season_summary.merge(
-        max_days[['season', 'dteday', 'hr', 'cnt']].rename(columns={
-            'dteday': 'dteday_max',
-            'hr': 'hr_max',
-            'cnt': 'cnt_max_actual'
-        }),
-        on='season'
-    ).merge(
-        min_days[['season', 'dteday', 'hr', 'cnt']].rename(columns={
-            'dteday': 'dteday_min',
-            'hr': 'hr_min',
-            'cnt': 'cnt_min_actual'
-        }),
-        on='season'
-    )
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(24, 8))
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_SIZE)
+def render_season_chart(mtime, start_date, end_date, seasons, day_types):
+    _, _, season_summary, _, _, _ = create_summaries(mtime, start_date, end_date, seasons, day_types)
+    fig = Figure(figsize=(24, 8))
+    ax1, ax2 = fig.subplots(1, 2)
     fig.suptitle('Analisis Penyewaan Sepeda per Musim', y=1.02, fontsize=18, fontweight='bold')
 
     # Plot penyewaan TERTINGGI per musim
@@ -260,7 +289,7 @@ else:
         x="season_label",
         y="cnt_max_actual",
         hue="season_label",
-        palette=SEASON_COLORS,
+        palette=SEASON_PALETTE,
         ax=ax1,
         edgecolor='black',
         linewidth=1,
@@ -270,12 +299,15 @@ else:
     ax1.set_xlabel("Musim", fontsize=14, labelpad=10)
     ax1.set_ylabel("Jumlah Penyewaan", fontsize=14, labelpad=10)
 
-    # Tambahkan label detail
-    for i, row in season_summary.iterrows():
+    # Tambahkan label detail (kolom diambil sekali sebagai array, bukan iterrows)
+    max_dates = season_summary["dteday_max"].dt.strftime("%d %b %Y").to_numpy()
+    max_hours = season_summary["hr_max"].to_numpy()
+    max_values = season_summary["cnt_max_actual"].to_numpy()
+    for i in range(len(max_values)):
         ax1.text(
             i, 
-            row["cnt_max_actual"] * 0.05,
-            f'Hari: {row["dteday_max"].strftime("%d %b %Y")}\nJam: {int(row["hr_max"])}:00\nTotal: {row["cnt_max_actual"]:,}',
+            max_values[i] * 0.05,
+            f'Hari: {max_dates[i]}\nJam: {int(max_hours[i])}:00\nTotal: {max_values[i]:,}',
             ha='center', 
             va='bottom', 
             fontsize=11,
@@ -288,7 +320,7 @@ else:
         x="season_label",
         y="cnt_min_actual",
         hue="season_label",
-        palette=SEASON_COLORS,
+        palette=SEASON_PALETTE,
         ax=ax2,
         edgecolor='black',
         linewidth=1,
@@ -298,12 +330,15 @@ else:
     ax2.set_xlabel("Musim", fontsize=14, labelpad=10)
     ax2.set_ylabel("Jumlah Penyewaan", fontsize=14, labelpad=10)
 
-    # Tambahkan label detail
-    for i, row in season_summary.iterrows():
+    # Tambahkan label detail (kolom diambil sekali sebagai array, bukan iterrows)
+    min_dates = season_summary["dteday_min"].dt.strftime("%d %b %Y").to_numpy()
+    min_hours = season_summary["hr_min"].to_numpy()
+    min_values = season_summary["cnt_min_actual"].to_numpy()
+    for i in range(len(min_values)):
         ax2.text(
             i, 
-            row["cnt_min_actual"] * 1.2,
-            f'Hari: {row["dteday_min"].strftime("%d %b %Y")}\nJam: {int(row["hr_min"])}:00\nTotal: {row["cnt_min_actual"]:,}',
+            min_values[i] * 1.2,
+            f'Hari: {min_dates[i]}\nJam: {int(min_hours[i])}:00\nTotal: {min_values[i]:,}',
             ha='center', 
             va='bottom', 
             fontsize=11,
@@ -315,16 +350,8 @@ else:
     ax2.set_ylim(0, season_summary["cnt_min_actual"].max() * 2.5)
 
     # Tambahkan legenda
-    from matplotlib.patches import Patch
-    legend_elements = [
-        Patch(facecolor=SEASON_COLORS[0], edgecolor='black', label='Musim Semi'),
-        Patch(facecolor=SEASON_COLORS[1], edgecolor='black', label='Musim Panas'),
-        Patch(facecolor=SEASON_COLORS[2], edgecolor='black', label='Musim Gugur'),
-        Patch(facecolor=SEASON_COLORS[3], edgecolor='black', label='Musim Dingin')
-    ]
-
     fig.legend(
-        handles=legend_elements,
+        handles=create_season_legend(),
         title='Keterangan Musim:',
         bbox_to_anchor=(0.5, -0.05),
         loc='lower center',
@@ -333,21 +360,13 @@ else:
         title_fontsize=13
     )
 
-    st.pyplot(fig)
-
-    # SECTION 4: POLA WEEKDAY VS WEEKEND (Pertanyaan 2)
-    st.header("📅 Pola Penyewaan: Weekday vs Weekend")
-    st.markdown("**Bagaimana distribusi penyewaan sepeda antara weekdays dan weekend?**")
-
-    # Create summary data
-    weekday_summary = main_df.groupby("day_type").agg({
-        'cnt': ['sum', 'mean', 'count']
-    }).reset_index()
-    weekday_summary.columns = ['day_type', 'total', 'average', 'count']
+    return figure_to_png(fig)
 
-    hourly_pattern = main_df.groupby(["hr", "day_type"])["cnt"].mean().reset_index()
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 7), gridspec_kw={'width_ratios': [1, 2]})
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_SIZE)
+def render_weekday_chart(mtime, start_date, end_date, seasons, day_types):
+    _, _, _, weekday_summary, hourly_pattern, _ = create_summaries(mtime, start_date, end_date, seasons, day_types)
+    fig = Figure(figsize=(20, 7))
+    ax1, ax2 = fig.subplots(1, 2, gridspec_kw={'width_ratios': [1, 2]})
     fig.suptitle('Analisis Pola Penyewaan Sepeda: Weekday vs Weekend', y=1.05, fontsize=18, fontweight='bold')
 
     # Chart 1: Total Penyewaan
@@ -355,7 +374,8 @@ else:
         data=weekday_summary,
         x="day_type",
         y="total",
-        palette=["#e74c3c", "#3498db"],  # Merah untuk weekend, Biru untuk weekday
+        # Warna dipetakan per label agar tidak bergantung pada urutan baris
+        palette={DAY_TYPE_LABELS[0]: "#e74c3c", DAY_TYPE_LABELS[1]: "#3498db"},  # Merah untuk weekend, Biru untuk weekday
         ax=ax1,
         edgecolor='black',
         linewidth=1,
@@ -367,11 +387,12 @@ else:
     ax1.set_ylabel("Total Penyewaan", labelpad=10)
 
     # Format angka
-    for i, row in weekday_summary.iterrows():
+    totals = weekday_summary["total"].to_numpy()
+    for i in range(len(totals)):
         ax1.text(
             i, 
-            row["total"] * 0.05,
-            f'{row["total"]/1e6:.2f}M',
+            totals[i] * 0.05,
+            f'{totals[i]/1e6:.2f}M',
             ha='center', 
             va='bottom', 
             fontsize=12,
@@ -379,20 +400,24 @@ else:
             bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', boxstyle='round,pad=0.3')
         )
 
-    # Chart 2: Pola per Jam
-    sns.lineplot(
-        data=hourly_pattern,
-        x="hr",
-        y="cnt",
-        hue="day_type",
-        style="day_type",
-        markers=True,
-        dashes=False,
-        markersize=8,
-        palette=["#3498db", "#e74c3c"],  # Biru untuk Weekday, Merah untuk Weekend
-        ax=ax2,
-        linewidth=2.5
-    )
+    # Chart 2: Pola per Jam (satu ax.plot per jenis hari dari tabel pivot)
+    hourly_pivot = hourly_pattern.pivot(index="hr", columns="day_type", values="cnt")
+    hourly_styles = {
+        DAY_TYPE_LABELS[1]: ("#3498db", "o"),  # Biru untuk Weekday
+        DAY_TYPE_LABELS[0]: ("#e74c3c", "X")   # Merah untuk Weekend
+    }
+    for day_type in hourly_pattern["day_type"].unique():
+        color, marker = hourly_styles[day_type]
+        ax2.plot(
+            hourly_pivot.index.values,
+            hourly_pivot[day_type].values,
+            color=color,
+            marker=marker,
+            markersize=8,
+            markeredgecolor='white',
+            linewidth=2.5,
+            label=day_type
+        )
     ax2.set_title("Rata-rata Penyewaan per Jam", pad=15)
     ax2.set_xlabel("Jam (0-23)", labelpad=10)
     ax2.set_ylabel("Rata-rata Penyewaan", labelpad=10)
@@ -421,29 +446,163 @@ else:
                       arrowprops=dict(facecolor='black', shrink=0.05),
                       bbox=dict(boxstyle='round,pad=0.5', fc='white', alpha=0.8))
 
-    st.pyplot(fig)
-
-    # SECTION 5: PENGARUH CUACA (Pertanyaan 3)
-    st.header("☀️ Pengaruh Kondisi Cuaca")
-    st.markdown("**Bagaimana perbedaan pola penyewaan sepeda per jam antara kondisi cuaca cerah dan berkabut?**")
-
-    weather_comparison = main_df[main_df['weathersit'].isin([1, 2])].groupby(['hr', 'weather_label'])['cnt'].mean().unstack()
-
-    fig, ax = plt.subplots(figsize=(16, 6))
-    sns.lineplot(
-        data=weather_comparison,
-        markers=True,
-        palette=WEATHER_COLORS,
-        linewidth=2.5,
-        ax=ax
-    )
+    return figure_to_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_SIZE)
+def render_weather_chart(mtime, start_date, end_date, seasons, day_types):
+    _, _, _, _, _, weather_comparison = create_summaries(mtime, start_date, end_date, seasons, day_types)
+    fig = Figure(figsize=(16, 6))
+    ax = fig.subplots()
+    weather_styles = {
+        WEATHER_LABELS[1]: (WEATHER_COLORS[0], "o", "-"),
+        WEATHER_LABELS[2]: (WEATHER_COLORS[1], "X", (0, (4, 1.5)))
+    }
+    for weather_label in weather_comparison.columns:
+        color, marker, linestyle = weather_styles[weather_label]
+        ax.plot(
+            weather_comparison.index.values,
+            weather_comparison[weather_label].values,
+            color=color,
+            marker=marker,
+            linestyle=linestyle,
+            markeredgecolor='white',
+            linewidth=2.5,
+            label=weather_label
+        )
     ax.set_title("Perbandingan Pola Penyewaan: Cuaca Cerah vs Berkabut", pad=20)
     ax.set_xlabel("Jam (0-23)")
     ax.set_ylabel("Rata-rata Penyewaan")
     ax.legend(title="Kondisi Cuaca")
     ax.set_xticks(range(0, 24))
 
-    st.pyplot(fig)
+    return figure_to_png(fig)
+
+# ====================
+# LOAD DATA
+# ====================
+data_mtime = os.path.getmtime(DATA_FILE)
+all_df = load_data(DATA_FILE, data_mtime)
+
+# ====================
+# SIDEBAR FILTER
+# ====================
+min_date = all_df['dteday'].min().date()
+max_date = all_df['dteday'].max().date()
+
+with st.sidebar:
+    col1, col2, col3 = st.columns([1,2,1])
+    with col2:
+        st.image("https://camo.githubusercontent.com/e7e99e60ef795eb3ae37545e6a1f84391d462097d74c69d378daaab5660ed444/687474703a2f2f6369747962696b2e65732f66696c65732f707962696b65732e706e67", 
+                 width=150)
+    
+    st.header("Filter Data")
+
+    # Date range filter dengan validasi
+    date_range = st.date_input(
+        label='Rentang Waktu',
+        min_value=min_date,
+        max_value=max_date,
+        value=[min_date, max_date]
+    )
+
+    if isinstance(date_range, tuple) and len(date_range) == 2:
+        start_date, end_date = date_range
+    else:
+        start_date, end_date = None, None
+
+    # Additional filters
+    selected_seasons = st.multiselect(
+        "Pilih Musim",
+        options=list(SEASON_LABELS.values()),
+        default=list(SEASON_LABELS.values())
+    )
+    
+    selected_day_types = st.multiselect(
+        "Pilih Jenis Hari",
+        options=list(DAY_TYPE_LABELS.values()),
+        default=list(DAY_TYPE_LABELS.values())
+    )
+
+# ====================
+# PROCESS DATA
+# ====================
+if not start_date or not end_date:
+    st.warning("Silahkan pilih rentang waktu terlebih dahulu.")
+    st.stop()
+
+filters = (data_mtime, start_date, end_date, tuple(selected_seasons), tuple(selected_day_types))
+main_df, daily_summary, _, _, _, _ = create_summaries(*filters)
+
+# Cek apakah main_df kosong
+if main_df.empty:
+    st.warning("Tidak ada data yang bisa kamu lihat, silahkan pilih filter lainnya.")
+else:
+    # argmax/argmin langsung pada array numpy, tanpa lookup label index pandas
+    cnt_values = main_df['cnt'].to_numpy()
+    max_day = main_df.iloc[int(cnt_values.argmax())]
+    min_day = main_df.iloc[int(cnt_values.argmin())]
+
+    # ====================
+    # DASHBOARD LAYOUT
+    # ====================
+    st.title('Dashboard Bike Sharing 🚲')
+    st.markdown("""
+    Dashboard ini menampilkan analisis pola penyewaan sepeda berdasarkan berbagai faktor seperti musim, 
+    cuaca, dan jenis hari. Gunakan filter di sidebar untuk menyesuaikan tampilan data.
+    """)
+
+    # TAMBAHKAN: TAMPILKAN RENTANG WAKTU YANG DIPILIH
+    st.subheader(f"📅 Periode: {start_date.strftime('%d %B %Y')} - {end_date.strftime('%d %B %Y')}")
+    st.markdown(f"""
+    - **Total Hari**: {(end_date - start_date).days + 1} hari
+    - **Musim Terpilih**: {', '.join(selected_seasons)}
+    - **Jenis Hari Terpilih**: {', '.join(selected_day_types)}
+    """)
+    st.markdown("---")
+
+    # SECTION 1: METRIC UTAMA
+    st.header("📊 Ringkasan Utama")
+    # Ketiga metrik diambil dari total harian yang sudah dihitung create_summaries
+    rentals_by_day = daily_summary['total']
+    total_rentals = int(rentals_by_day.sum())
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Penyewaan", 
+                 value=f"{total_rentals:,}",
+                 help="Total sepeda yang disewa dalam periode terpilih")
+        
+    with col2:
+        st.metric("Rata-rata Harian", 
+                 value=f"{rentals_by_day.mean():.0f}",
+                 help="Rata-rata penyewaan per hari")
+        
+    with col3:
+        st.metric("Puncak Tertinggi", 
+                 value=f"{rentals_by_day.max():,}",
+                 help="Penyewaan tertinggi dalam satu hari")
+
+    # SECTION 2: TREN HARIAN
+    st.header("📈 Tren Harian Penyewaan")
+    st.image(render_daily_chart(*filters), use_container_width=True)
+
+    # SECTION 3: ANALISIS MUSIMAN (Pertanyaan 1)
+    st.header("🍂 Analisis Musiman")
+    st.markdown("**Bagaimana distribusi penyewaan tertinggi dan terendah dalam satu musim bila diukur dengan jam serta hari?**")
+
+    st.image(render_season_chart(*filters), use_container_width=True)
+
+    # SECTION 4: POLA WEEKDAY VS WEEKEND (Pertanyaan 2)
+    st.header("📅 Pola Penyewaan: Weekday vs Weekend")
+    st.markdown("**Bagaimana distribusi penyewaan sepeda antara weekdays dan weekend?**")
+
+    st.image(render_weekday_chart(*filters), use_container_width=True)
+
+    # SECTION 5: PENGARUH CUACA (Pertanyaan 3)
+    st.header("☀️ Pengaruh Kondisi Cuaca")
+    st.markdown("**Bagaimana perbedaan pola penyewaan sepeda per jam antara kondisi cuaca cerah dan berkabut?**")
+
+    st.image(render_weather_chart(*filters), use_container_width=True)
 
     # SECTION 6: REKOR PENYEWAAN
     st.header("🏆 Rekor Penyewaan")